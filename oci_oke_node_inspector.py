@@ -1,29 +1,46 @@
 #!/usr/bin/env python3
+import bisect
+import collections
+import json
 import os
+import re
 import sys
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Tuple
 from pathlib import Path
 
 import click
-from dotenv import load_dotenv
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.layout import Layout
 from rich.text import Text
 from rich import box
-from rich.progress import Progress, BarColumn, TextColumn
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 console = Console()
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeMetrics:
     name: str
     cpu_usage: int
@@ -35,69 +52,320 @@ class NodeMetrics:
     status: str
     labels: Dict[str, str]
     conditions: List[Dict]
-    taints: List[Dict]
+    taints: List[Tuple[str, str, str]]
+    cpu_pct: float = 0.0
+    mem_pct: float = 0.0
+    pod_pct: float = 0.0
 
 
 def load_config_from_env() -> Dict[str, str]:
     env_path = Path('.env')
     if env_path.exists():
+        # Deferred import: only paid for when a .env file is actually present.
+        from dotenv import load_dotenv
         load_dotenv(env_path)
     return {
         'k8s_context': os.getenv('K8S_CONTEXT', ''),
     }
 
 
-def get_node_metrics(core_v1: client.CoreV1Api, metrics_api) -> List[NodeMetrics]:
-    nodes = core_v1.list_node()
-    try:
-        metrics = metrics_api.list_node_metrics()
-        metrics_map = {m.metadata.name: m for m in metrics.items}
-    except Exception as e:
-        logger.warning(f"Metrics API unavailable: {e}")
-        metrics_map = {}
+def list_nodes(core_v1: client.CoreV1Api) -> List:
+    """List all nodes in one watch-cache read.
+
+    resource_version='0' serves the list from the apiserver's in-memory cache
+    instead of a quorum etcd read; fine for a read-only snapshot. The cache
+    does not paginate, so a limit/continue loop would be ignored anyway.
+    """
+    return core_v1.list_node(resource_version='0').items
+
+
+def count_pods_per_node(core_v1: client.CoreV1Api) -> collections.Counter:
+    """Count pods per node without deserializing full pod objects.
+
+    Streams the raw pod list response and extracts only spec.nodeName; falls
+    back to the fully-modelled client call when ijson is unavailable.
+    """
+    if ijson is not None:
+        resp = core_v1.api_client.call_api(
+            '/api/v1/pods', 'GET',
+            query_params=[('resourceVersion', '0')],
+            auth_settings=['BearerToken'],
+            _preload_content=False,
+            _return_http_data_only=True,
+        )
+        try:
+            return collections.Counter(
+                name for name in ijson.items(resp, 'items.item.spec.nodeName')
+                if name
+            )
+        finally:
+            resp.release_conn()
+
+    all_pods = core_v1.list_pod_for_all_namespaces(resource_version='0', watch=False)
+    return collections.Counter(
+        p.spec.node_name for p in all_pods.items if p.spec.node_name
+    )
+
 
-    node_metrics = []
-    for node in nodes.items:
-        name = node.metadata.name
+def get_node_metrics(core_v1: client.CoreV1Api, metrics_api,
+                     filter_tainted: bool = False,
+                     verbose: bool = False) -> List[NodeMetrics]:
+    # The node list, pod list, and metrics list are independent; issue them
+    # concurrently so wall time is the slowest call rather than the sum.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        nodes_future = pool.submit(list_nodes, core_v1)
+        metrics_future = (
+            pool.submit(metrics_api.list_node_metrics) if metrics_api else None
+        )
+        # One cluster-wide pod list instead of a field-selected list per node.
+        # It stays concurrent with the node list even under --filter-tainted;
+        # if the filter empties the node set the result is simply discarded.
+        pods_future = pool.submit(count_pods_per_node, core_v1)
+
+        nodes = nodes_future.result()
+        if filter_tainted:
+            nodes = [n for n in nodes if n.spec.taints]
 
-        cpu_capacity = int(node.status.capacity.get('cpu', '0'))
-        memory_capacity = parse_memory(node.status.capacity.get('memory', '0'))
-        pod_capacity = int(node.status.allocatable.get('pods', '0'))
+        try:
+            if metrics_future is None:
+                raise RuntimeError("metrics API not configured")
+            metrics_map = metrics_future.result()
+        except Exception as e:
+            logger.warning(f"Metrics API unavailable: {e}")
+            metrics_map = {}
 
-        if name in metrics_map:
-            m = metrics_map[name]
-            cpu_usage = parse_cpu(m.usage.get('cpu', '0'))
-            memory_usage = parse_memory(m.usage.get('memory', '0'))
+        if nodes:
+            pod_counts = pods_future.result()
         else:
-            cpu_usage = 0
-            memory_usage = 0
+            pods_future.cancel()
+            pod_counts = collections.Counter()
 
-        pods = core_v1.list_pod_for_all_namespaces(field_selector=f'spec.nodeName={name}')
-        pod_count = len(pods.items)
+    return [build_node_metrics(node, metrics_map, pod_counts, verbose) for node in nodes]
 
-        status = "Ready" if any(c.type == "Ready" and c.status == "True" for c in node.status.conditions) else "NotReady"
 
-        labels = node.metadata.labels or {}
-        conditions = [{'type': c.type, 'status': c.status, 'reason': c.reason or ''} for c in node.status.conditions]
-        taints = [{'key': t.key, 'effect': t.effect, 'value': t.value or ''} for t in (node.spec.taints or [])]
+def build_node_metrics(node, metrics_map: Dict[str, Dict],
+                       pod_counts: collections.Counter,
+                       verbose: bool = False) -> NodeMetrics:
+    # Alias the nested attribute chains once; this runs per node and each
+    # extra dotted lookup is a dict probe on the generated client models.
+    meta = node.metadata
+    st = node.status
+    capacity = st.capacity
 
-        node_metrics.append(NodeMetrics(
-            name=name,
-            cpu_usage=cpu_usage,
-            cpu_capacity=cpu_capacity * 1000,
-            memory_usage=memory_usage,
-            memory_capacity=memory_capacity,
-            pod_count=pod_count,
-            pod_capacity=pod_capacity,
-            status=status,
-            labels=labels,
-            conditions=conditions,
-            taints=taints
-        ))
+    name = meta.name
 
-    return node_metrics
+    cpu_capacity = int(capacity.get('cpu', '0'))
+    memory_capacity = parse_memory(capacity.get('memory', '0'))
+    pod_capacity = int(st.allocatable.get('pods', '0'))
 
+    usage = metrics_map.get(name)
+    if usage:
+        cpu_usage = parse_cpu(usage.get('cpu', '0'))
+        memory_usage = parse_memory(usage.get('memory', '0'))
+    else:
+        cpu_usage = 0
+        memory_usage = 0
+
+    pod_count = pod_counts.get(name, 0)
 
+    status = "NotReady"
+    conditions = []
+    if verbose:
+        # One pass over the conditions: collect them and spot Ready on the way.
+        for c in st.conditions:
+            if c.type == "Ready" and c.status == "True":
+                status = "Ready"
+            conditions.append({'type': c.type, 'status': c.status, 'reason': c.reason or ''})
+    else:
+        # Nothing renders the conditions without --verbose, so skip the dicts
+        # and stop at the Ready condition.
+        for c in st.conditions:
+            if c.type == "Ready":
+                if c.status == "True":
+                    status = "Ready"
+                break
+
+    labels = meta.labels or {}
+    taints = [(t.key, t.effect, t.value or '') for t in (node.spec.taints or ())]
+
+    cpu_capacity_m = cpu_capacity * 1000
+
+    return NodeMetrics(
+        name=name,
+        cpu_usage=cpu_usage,
+        cpu_capacity=cpu_capacity_m,
+        memory_usage=memory_usage,
+        memory_capacity=memory_capacity,
+        pod_count=pod_count,
+        pod_capacity=pod_capacity,
+        status=status,
+        labels=labels,
+        conditions=conditions,
+        taints=taints,
+        cpu_pct=(cpu_usage / cpu_capacity_m * 100) if cpu_capacity_m else 0.0,
+        mem_pct=(memory_usage / memory_capacity * 100) if memory_capacity else 0.0,
+        pod_pct=(pod_count / pod_capacity * 100) if pod_capacity else 0.0
+    )
+
+
+_WATCH_REFRESH_SECONDS = 5
+_WATCH_TIMEOUT_SECONDS = 60
+
+
+class ClusterWatcher:
+    """Maintains in-memory node and pod-count caches fed by watch streams.
+
+    Re-listing the whole cluster on every refresh costs O(cluster) apiserver
+    work per tick; after the initial list, watches keep steady-state traffic
+    proportional to what actually changed.
+    """
+
+    def __init__(self, core_v1: client.CoreV1Api):
+        self.core_v1 = core_v1
+        self._lock = threading.Lock()
+        self._nodes: Dict[str, object] = {}
+        self._pod_nodes: Dict[str, str] = {}
+        self._pod_counts: collections.Counter = collections.Counter()
+        self._stop = threading.Event()
+
+    def start(self):
+        node_rv = self._relist_nodes()
+        pod_rv = self._relist_pods()
+
+        threading.Thread(
+            target=self._watch_nodes,
+            args=(node_rv,),
+            daemon=True
+        ).start()
+        threading.Thread(
+            target=self._watch_pods,
+            args=(pod_rv,),
+            daemon=True
+        ).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def snapshot(self):
+        with self._lock:
+            return list(self._nodes.values()), collections.Counter(self._pod_counts)
+
+    def _relist_nodes(self) -> str:
+        """Rebuild the node cache from a fresh LIST; returns its resourceVersion."""
+        node_list = self.core_v1.list_node(resource_version='0')
+        with self._lock:
+            self._nodes = {n.metadata.name: n for n in node_list.items}
+        return node_list.metadata.resource_version
+
+    def _relist_pods(self) -> str:
+        """Rebuild the pod-count caches from a fresh LIST; returns its resourceVersion."""
+        pod_list = self.core_v1.list_pod_for_all_namespaces(resource_version='0', watch=False)
+        pod_nodes = {}
+        pod_counts = collections.Counter()
+        for p in pod_list.items:
+            if p.spec.node_name:
+                pod_nodes[p.metadata.uid] = p.spec.node_name
+                pod_counts[p.spec.node_name] += 1
+        with self._lock:
+            self._pod_nodes = pod_nodes
+            self._pod_counts = pod_counts
+        return pod_list.metadata.resource_version
+
+    def _handle_node_event(self, event):
+        node = event['object']
+        with self._lock:
+            if event['type'] == 'DELETED':
+                self._nodes.pop(node.metadata.name, None)
+            else:
+                self._nodes[node.metadata.name] = node
+
+    def _handle_pod_event(self, event):
+        pod = event['object']
+        uid = pod.metadata.uid
+        with self._lock:
+            previous = self._pod_nodes.get(uid)
+            if event['type'] == 'DELETED':
+                if previous:
+                    self._pod_nodes.pop(uid, None)
+                    self._pod_counts[previous] -= 1
+            else:
+                node_name = pod.spec.node_name
+                if node_name and node_name != previous:
+                    if previous:
+                        self._pod_counts[previous] -= 1
+                    self._pod_nodes[uid] = node_name
+                    self._pod_counts[node_name] += 1
+
+    def _watch_nodes(self, resource_version):
+        self._watch_loop(self.core_v1.list_node, self._handle_node_event,
+                         self._relist_nodes, resource_version)
+
+    def _watch_pods(self, resource_version):
+        self._watch_loop(self.core_v1.list_pod_for_all_namespaces, self._handle_pod_event,
+                         self._relist_pods, resource_version)
+
+    def _watch_loop(self, list_func, handle_event, relist, resource_version):
+        w = watch.Watch()
+        while not self._stop.is_set():
+            try:
+                for event in w.stream(list_func, resource_version=resource_version,
+                                      timeout_seconds=_WATCH_TIMEOUT_SECONDS):
+                    handle_event(event)
+                    resource_version = event['object'].metadata.resource_version
+                    if self._stop.is_set():
+                        return
+            except ApiException as e:
+                if e.status == 410:
+                    # Fell behind etcd compaction: events between our last
+                    # resourceVersion and now are gone, so re-list to rebuild
+                    # the cache and resume the watch from the fresh version.
+                    try:
+                        resource_version = relist()
+                    except Exception as relist_err:
+                        logger.warning(f"Re-list after 410 failed on {list_func.__name__}: {relist_err}")
+                        self._stop.wait(_WATCH_REFRESH_SECONDS)
+                else:
+                    logger.warning(f"Watch error on {list_func.__name__}: {e}")
+                    self._stop.wait(_WATCH_REFRESH_SECONDS)
+            except Exception as e:
+                logger.warning(f"Watch error on {list_func.__name__}: {e}")
+                self._stop.wait(_WATCH_REFRESH_SECONDS)
+
+
+def run_watch_mode(core_v1: client.CoreV1Api, metrics_api,
+                   filter_tainted: bool, filter_high_usage: bool, sort_by: str):
+    watcher = ClusterWatcher(core_v1)
+    watcher.start()
+    try:
+        while True:
+            metrics_map = {}
+            if metrics_api:
+                try:
+                    # metrics.k8s.io has no watch support, so usage is polled.
+                    metrics_map = metrics_api.list_node_metrics()
+                except Exception as e:
+                    logger.debug(f"Metrics API unavailable: {e}")
+
+            raw_nodes, pod_counts = watcher.snapshot()
+            nodes = [build_node_metrics(n, metrics_map, pod_counts) for n in raw_nodes]
+            nodes = select_nodes(nodes, filter_tainted, filter_high_usage, sort_by)
+
+            console.clear()
+            print_summary(nodes)
+            # One Group print measures and flushes once instead of per node.
+            console.print(Group(*(make_node_panel(n) for n in nodes)))
+            console.print("[dim]Watching for changes (Ctrl+C to exit)...[/dim]")
+
+            time.sleep(_WATCH_REFRESH_SECONDS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+
+
+# Quantity strings repeat heavily across nodes (every node of a shape reports
+# the same capacity), so memoizing turns repeat parses into a C-level cache hit.
+@lru_cache(maxsize=1024)
 def parse_cpu(cpu_str: str) -> int:
     if cpu_str.endswith('n'):
         return int(cpu_str[:-1]) // 1_000_000
@@ -107,22 +375,28 @@ def parse_cpu(cpu_str: str) -> int:
         return int(cpu_str) * 1000
 
 
+_MEM_SUFFIX = {
+    'Ki': 1024,
+    'Mi': 1024 ** 2,
+    'Gi': 1024 ** 3,
+    'Ti': 1024 ** 4,
+    'K': 1000,
+    'M': 1000 ** 2,
+    'G': 1000 ** 3,
+    'T': 1000 ** 4,
+}
+
+
+@lru_cache(maxsize=1024)
 def parse_memory(mem_str: str) -> int:
     mem_str = str(mem_str).strip()
-    if mem_str.endswith('Ki'):
-        return int(mem_str[:-2]) * 1024
-    elif mem_str.endswith('Mi'):
-        return int(mem_str[:-2]) * 1024 * 1024
-    elif mem_str.endswith('Gi'):
-        return int(mem_str[:-2]) * 1024 * 1024 * 1024
-    elif mem_str.endswith('K'):
-        return int(mem_str[:-1]) * 1000
-    elif mem_str.endswith('M'):
-        return int(mem_str[:-1]) * 1000 * 1000
-    elif mem_str.endswith('G'):
-        return int(mem_str[:-1]) * 1000 * 1000 * 1000
-    else:
-        return int(mem_str)
+    mul = _MEM_SUFFIX.get(mem_str[-2:])
+    if mul:
+        return int(mem_str[:-2]) * mul
+    mul = _MEM_SUFFIX.get(mem_str[-1:])
+    if mul:
+        return int(mem_str[:-1]) * mul
+    return int(mem_str)
 
 
 def format_memory(bytes_val: int) -> str:
@@ -133,21 +407,20 @@ def format_memory(bytes_val: int) -> str:
     return f"{mb:.0f}Mi"
 
 
+_AUTOSCALE_LABEL_RE = re.compile(r'autoscal|scale', re.IGNORECASE)
+
+_USAGE_THRESHOLDS = (50, 75, 90)
+_USAGE_COLORS = ('green', 'cyan', 'yellow', 'red')
+
+
 def get_color_for_usage(percent: float) -> str:
-    if percent >= 90:
-        return "red"
-    elif percent >= 75:
-        return "yellow"
-    elif percent >= 50:
-        return "cyan"
-    else:
-        return "green"
+    return _USAGE_COLORS[bisect.bisect_right(_USAGE_THRESHOLDS, percent)]
 
 
-def print_node_details(node: NodeMetrics):
-    cpu_percent = (node.cpu_usage / node.cpu_capacity * 100) if node.cpu_capacity > 0 else 0
-    mem_percent = (node.memory_usage / node.memory_capacity * 100) if node.memory_capacity > 0 else 0
-    pod_percent = (node.pod_count / node.pod_capacity * 100) if node.pod_capacity > 0 else 0
+def make_node_panel(node: NodeMetrics) -> Panel:
+    cpu_percent = node.cpu_pct
+    mem_percent = node.mem_pct
+    pod_percent = node.pod_pct
 
     status_color = "green" if node.status == "Ready" else "red"
 
@@ -155,44 +428,49 @@ def print_node_details(node: NodeMetrics):
     table.add_column("Key", style="bold dim")
     table.add_column("Value")
 
-    table.add_row("Status", f"[{status_color}]{node.status}[/{status_color}]")
-    table.add_row("Pods", f"{node.pod_count}/{node.pod_capacity} [{get_color_for_usage(pod_percent)}]({pod_percent:.0f}%)[/{get_color_for_usage(pod_percent)}]")
+    table.add_row("Status", f"[{status_color}]{node.status}[/]")
+
+    pod_color = get_color_for_usage(pod_percent)
+    table.add_row("Pods", f"{node.pod_count}/{node.pod_capacity} [{pod_color}]({pod_percent:.0f}%)[/]")
 
     cpu_color = get_color_for_usage(cpu_percent)
-    table.add_row("CPU", f"{node.cpu_usage}m/{node.cpu_capacity}m [{cpu_color}]({cpu_percent:.0f}%)[/{cpu_color}]")
+    table.add_row("CPU", f"{node.cpu_usage}m/{node.cpu_capacity}m [{cpu_color}]({cpu_percent:.0f}%)[/]")
 
     mem_color = get_color_for_usage(mem_percent)
-    table.add_row("Memory", f"{format_memory(node.memory_usage)}/{format_memory(node.memory_capacity)} [{mem_color}]({mem_percent:.0f}%)[/{mem_color}]")
+    table.add_row("Memory", f"{format_memory(node.memory_usage)}/{format_memory(node.memory_capacity)} [{mem_color}]({mem_percent:.0f}%)[/]")
 
     if node.taints:
         for i, t in enumerate(node.taints):
             label = "Taints" if i == 0 else ""
-            table.add_row(label, f"[red]{t['key']}={t['effect']}[/red]")
+            table.add_row(label, f"[red]{t[0]}={t[1]}[/]")
 
-    autoscaler_labels = {k: v for k, v in node.labels.items() if 'autoscal' in k.lower() or 'scale' in k.lower()}
-    if autoscaler_labels:
-        for k, v in autoscaler_labels.items():
-            table.add_row(f"  {k}", f"[cyan]{v}[/cyan]")
+    for k, v in node.labels.items():
+        if _AUTOSCALE_LABEL_RE.search(k):
+            table.add_row(f"  {k}", f"[cyan]{v}[/]")
 
-    panel = Panel(
+    return Panel(
         table,
-        title=f"[bold cyan]{node.name}[/bold cyan]",
+        title=f"[bold cyan]{node.name}[/]",
         border_style=status_color,
         box=box.ROUNDED
     )
-    console.print(panel)
 
 
 def print_summary(nodes: List[NodeMetrics]):
     total_nodes = len(nodes)
-    ready_nodes = sum(1 for n in nodes if n.status == "Ready")
-    total_cpu_usage = sum(n.cpu_usage for n in nodes)
-    total_cpu_capacity = sum(n.cpu_capacity for n in nodes)
-    total_mem_usage = sum(n.memory_usage for n in nodes)
-    total_mem_capacity = sum(n.memory_capacity for n in nodes)
-    total_pods = sum(n.pod_count for n in nodes)
 
-    tainted_nodes = sum(1 for n in nodes if n.taints)
+    # Accumulate everything in one pass instead of seven generator sweeps.
+    ready_nodes = tainted_nodes = total_pods = 0
+    total_cpu_usage = total_cpu_capacity = 0
+    total_mem_usage = total_mem_capacity = 0
+    for n in nodes:
+        ready_nodes += n.status == "Ready"
+        tainted_nodes += bool(n.taints)
+        total_cpu_usage += n.cpu_usage
+        total_cpu_capacity += n.cpu_capacity
+        total_mem_usage += n.memory_usage
+        total_mem_capacity += n.memory_capacity
+        total_pods += n.pod_count
 
     cpu_percent = (total_cpu_usage / total_cpu_capacity * 100) if total_cpu_capacity > 0 else 0
     mem_percent = (total_mem_usage / total_mem_capacity * 100) if total_mem_capacity > 0 else 0
@@ -201,19 +479,19 @@ def print_summary(nodes: List[NodeMetrics]):
     table.add_column("Metric", style="bold")
     table.add_column("Value")
 
-    table.add_row("Cluster", f"[cyan]{os.getenv('K8S_CONTEXT', 'current')}[/cyan]")
+    table.add_row("Cluster", f"[cyan]{os.getenv('K8S_CONTEXT', 'current')}[/]")
     table.add_row("Total Nodes", f"{total_nodes}")
-    table.add_row("Ready Nodes", f"[green]{ready_nodes}[/green] / {total_nodes}")
-    table.add_row("Tainted Nodes", f"[yellow]{tainted_nodes}[/yellow]" if tainted_nodes > 0 else "[dim]0[/dim]")
+    table.add_row("Ready Nodes", f"[green]{ready_nodes}[/] / {total_nodes}")
+    table.add_row("Tainted Nodes", f"[yellow]{tainted_nodes}[/]" if tainted_nodes > 0 else "[dim]0[/dim]")
     table.add_row("", "")
 
     cpu_color = get_color_for_usage(cpu_percent)
-    table.add_row("Cluster CPU", f"[{cpu_color}]{cpu_percent:.1f}%[/{cpu_color}] ({total_cpu_usage}m / {total_cpu_capacity}m)")
+    table.add_row("Cluster CPU", f"[{cpu_color}]{cpu_percent:.1f}%[/] ({total_cpu_usage}m / {total_cpu_capacity}m)")
 
     mem_color = get_color_for_usage(mem_percent)
-    table.add_row("Cluster Memory", f"[{mem_color}]{mem_percent:.1f}%[/{mem_color}] ({format_memory(total_mem_usage)} / {format_memory(total_mem_capacity)})")
+    table.add_row("Cluster Memory", f"[{mem_color}]{mem_percent:.1f}%[/] ({format_memory(total_mem_usage)} / {format_memory(total_mem_capacity)})")
 
-    table.add_row("Total Pods", f"[blue]{total_pods}[/blue]")
+    table.add_row("Total Pods", f"[blue]{total_pods}[/]")
 
     header = Panel(
         Text("OKE Node Inspector", style="bold cyan", justify="center"),
@@ -227,12 +505,34 @@ def print_summary(nodes: List[NodeMetrics]):
     console.print()
 
 
+_SORT_KEYS = {
+    'cpu': attrgetter('cpu_pct'),
+    'memory': attrgetter('mem_pct'),
+    'pods': attrgetter('pod_pct'),
+    'name': attrgetter('name'),
+}
+
+
+def select_nodes(nodes: List[NodeMetrics], filter_tainted: bool,
+                 filter_high_usage: bool, sort_by: str) -> List[NodeMetrics]:
+    if filter_tainted:
+        nodes = [n for n in nodes if n.taints]
+
+    if filter_high_usage:
+        nodes = [n for n in nodes if n.cpu_pct > 75 or n.mem_pct > 75]
+
+    nodes.sort(key=_SORT_KEYS[sort_by], reverse=(sort_by != 'name'))
+
+    return nodes
+
+
 @click.command()
 @click.option('--filter-tainted', is_flag=True, help='Show only tainted nodes')
 @click.option('--filter-high-usage', is_flag=True, help='Show nodes with >75% CPU or memory')
 @click.option('--sort-by', type=click.Choice(['cpu', 'memory', 'pods', 'name']), default='name', help='Sort nodes by metric')
+@click.option('--watch', 'watch_mode', is_flag=True, help='Keep running, refreshing from watch events instead of re-listing')
 @click.option('--verbose', is_flag=True, help='Show detailed node conditions')
-def main(filter_tainted: bool, filter_high_usage: bool, sort_by: str, verbose: bool):
+def main(filter_tainted: bool, filter_high_usage: bool, sort_by: str, watch_mode: bool, verbose: bool):
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
@@ -244,70 +544,59 @@ def main(filter_tainted: bool, filter_high_usage: bool, sort_by: str, verbose: b
         else:
             config.load_kube_config()
 
-        core_v1 = client.CoreV1Api()
+        k8s_config = client.Configuration.get_default_copy()
+        # Enough pooled keep-alive connections for the concurrent list calls,
+        # so each request reuses a warm TLS session to the regional OKE
+        # control plane instead of paying a fresh handshake.
+        k8s_config.connection_pool_maxsize = 16
+        api_client = client.ApiClient(configuration=k8s_config)
+        # Large list responses compress extremely well; the apiserver gzips
+        # anything sizeable when asked and urllib3 decompresses transparently.
+        api_client.set_default_header('Accept-Encoding', 'gzip')
+        core_v1 = client.CoreV1Api(api_client)
 
         try:
             from kubernetes import client as k8s_client
-            metrics_api = k8s_client.CustomObjectsApi()
+            metrics_api = k8s_client.CustomObjectsApi(api_client)
 
             class MetricsAPI:
                 def __init__(self, custom_api):
                     self.custom_api = custom_api
 
-                def list_node_metrics(self):
-                    result = self.custom_api.list_cluster_custom_object(
+                def list_node_metrics(self) -> Dict[str, Dict]:
+                    # _preload_content=False skips the client's stock json
+                    # deserialization so the response can go through orjson.
+                    resp = self.custom_api.list_cluster_custom_object(
                         group="metrics.k8s.io",
                         version="v1beta1",
-                        plural="nodes"
+                        plural="nodes",
+                        resource_version='0',
+                        _preload_content=False
                     )
-
-                    class MetricItem:
-                        def __init__(self, data):
-                            self.metadata = type('obj', (object,), {'name': data['metadata']['name']})
-                            self.usage = data['usage']
-
-                    class MetricsList:
-                        def __init__(self, data):
-                            self.items = [MetricItem(item) for item in data['items']]
-
-                    return MetricsList(result)
+                    result = _json_loads(resp.data)
+                    return {item['metadata']['name']: item['usage'] for item in result['items']}
 
             metrics_api = MetricsAPI(metrics_api)
         except Exception as e:
             logger.warning(f"Metrics API setup failed: {e}")
             metrics_api = None
 
-        nodes = get_node_metrics(core_v1, metrics_api)
+        if watch_mode:
+            run_watch_mode(core_v1, metrics_api, filter_tainted, filter_high_usage, sort_by)
+            return
 
-        if filter_tainted:
-            nodes = [n for n in nodes if n.taints]
-
-        if filter_high_usage:
-            nodes = [n for n in nodes if
-                     (n.cpu_usage / n.cpu_capacity * 100 > 75 if n.cpu_capacity > 0 else False) or
-                     (n.memory_usage / n.memory_capacity * 100 > 75 if n.memory_capacity > 0 else False)]
-
-        if sort_by == 'cpu':
-            nodes.sort(key=lambda n: n.cpu_usage / n.cpu_capacity if n.cpu_capacity > 0 else 0, reverse=True)
-        elif sort_by == 'memory':
-            nodes.sort(key=lambda n: n.memory_usage / n.memory_capacity if n.memory_capacity > 0 else 0, reverse=True)
-        elif sort_by == 'pods':
-            nodes.sort(key=lambda n: n.pod_count / n.pod_capacity if n.pod_capacity > 0 else 0, reverse=True)
-        else:
-            nodes.sort(key=lambda n: n.name)
+        nodes = get_node_metrics(core_v1, metrics_api, filter_tainted, verbose)
+        nodes = select_nodes(nodes, filter_tainted, filter_high_usage, sort_by)
 
         print_summary(nodes)
-
-        for node in nodes:
-            print_node_details(node)
-
+        console.print(Group(*(make_node_panel(n) for n in nodes)))
         console.print()
 
     except ApiException as e:
-        console.print(f"[red]Kubernetes API error: {e.reason}[/red]")
+        console.print(f"[red]Kubernetes API error: {e.reason}[/]")
         sys.exit(1)
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        console.print(f"[red]Error: {e}[/]")
         if verbose:
             import traceback
             traceback.print_exc()